@@ -17,6 +17,7 @@ functions. The purpose is to convert imperative style code to functional or grap
 
 import functools
 import warnings
+import weakref
 from typing import Any, Callable, Iterator, SupportsIndex, Tuple, Union
 
 import jax
@@ -554,6 +555,17 @@ def converted_call(fn, args, kwargs, caller_fn_scope=None, options=None):
         # For QNode calls, we employ a wrapper to correctly forward the quantum function call to
         # autograph, while still invoking the QNode call method in the surrounding tracing context.
         if isinstance(fn, qml.QNode):
+            # When all arguments are positional tracers, they can be forwarded as QNode arguments
+            # without changing their semantics (keyword arguments are not supported by QNode
+            # tracing). The wrapping QNode is then re-used across calls, which lets repeated calls
+            # skip the tracing of the QNode body.
+            callopts = options or getattr(caller_fn_scope, "callopts", None)
+            if (
+                callopts is not None
+                and not kwargs
+                and all(isinstance(arg, jax.core.Tracer) for arg in jax.tree_util.tree_leaves(args))
+            ):
+                return _get_converted_qnode(fn, callopts)(*args)
 
             @functools.wraps(fn.func)
             def qnode_call_wrapper():
@@ -565,6 +577,36 @@ def converted_call(fn, args, kwargs, caller_fn_scope=None, options=None):
         return ag_converted_call(fn, args, kwargs, caller_fn_scope, options)
 
 
+# QNodes wrapping the AutoGraph conversion of user QNodes, keyed by the user QNode and then by the
+# conversion options. The wrappers only refer to the quantum function of the user QNode, so that
+# entries are released together with it.
+_converted_qnodes = weakref.WeakKeyDictionary()
+
+
+def _get_converted_qnode(qnode, callopts):
+    """Get a QNode that forwards its arguments to the AutoGraph conversion of the quantum function
+    of ``qnode``. The QNode is built once for each set of conversion options, and rebuilt if the
+    device or the differentiation method of ``qnode`` changes."""
+    converted = _converted_qnodes.setdefault(qnode, {})
+    new_qnode = converted.get(callopts)
+    if (
+        new_qnode is None
+        or new_qnode.device is not qnode.device
+        or new_qnode.diff_method != qnode.diff_method
+    ):
+        func = qnode.func
+
+        @functools.wraps(func)
+        def qnode_call_wrapper(*args, **kwargs):
+            return ag_converted_call(func, args, kwargs, options=callopts)
+
+        new_qnode = qml.QNode(
+            qnode_call_wrapper, device=qnode.device, diff_method=qnode.diff_method
+        )
+        converted[callopts] = new_qnode
+    return new_qnode
+
+
 class CRange:
     """Catalyst range object.
 
@@ -36,7 +36,6 @@ from typing import Hashable
 
 import cudaq
 import jax
-import pennylane as qml
 from jax.tree_util import tree_unflatten
 
 import catalyst
@@ -73,9 +72,7 @@ from catalyst.jax_primitives import (
     zne_p,
 )
 from catalyst.jax_tracer import trace_to_jaxpr
-from catalyst.pennylane_extensions import QFunc
 from catalyst.utils.exceptions import CompileError
-from catalyst.utils.patching import Patcher
 from catalyst.utils.toml import toml_load
 
 from .primitives import (
@@ -830,9 +827,8 @@ class QJIT_CUDAQ:
 
             return config, device.name, None, None
 
-        with Patcher(
+        with catalyst.pennylane_extensions.qnode_capture_scope(
             (catalyst.pennylane_extensions.QFunc, "extract_backend_info", cudaq_backend_info),
-            (qml.QNode, "__call__", QFunc.__call__),
         ):
             func = self.user_function
             abs_axes = {}
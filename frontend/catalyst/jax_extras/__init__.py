@@ -33,14 +33,17 @@ from catalyst.jax_extras.tracing import (
     _extract_implicit_args,
     _initial_style_jaxpr,
     _input_type_to_tracers,
+    abstractify_many,
     convert_constvars_jaxpr,
     convert_element_type,
     deduce_avals,
+    deduce_flat_avals,
     eval_jaxpr,
     get_implicit_and_explicit_flat_args,
     infer_lambda_input_type,
     initial_style_jaxprs_with_common_consts1,
     initial_style_jaxprs_with_common_consts2,
+    initial_style_jaxprs_with_shared_consts,
     make_jaxpr2,
     make_jaxpr_effects,
     new_dynamic_main2,
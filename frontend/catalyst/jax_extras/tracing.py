@@ -43,7 +43,7 @@ from jax._src.util import partition_list, safe_map, unzip2, unzip3, wraps
 from jax.api_util import flatten_fun
 from jax.core import ClosedJaxpr, Jaxpr, JaxprEqn, MainTrace, OutputType
 from jax.core import Primitive as JaxprPrimitive
-from jax.core import ShapedArray, Trace, eval_jaxpr, gensym, thread_local_state
+from jax.core import ShapedArray, Trace, eval_jaxpr, gensym, raise_to_shaped, thread_local_state
 from jax.extend.linear_util import wrap_init
 from jax.interpreters.partial_eval import (
     DynamicJaxprTrace,
@@ -76,11 +76,13 @@ __all__ = (
     "PyTreeRegistry",
     "ShapedArray",
     "ShapeDtypeStruct",
+    "abstractify_many",
     "convert_constvars_jaxpr",
     "convert_element_type",
     "eval_jaxpr",
     "initial_style_jaxprs_with_common_consts1",
     "initial_style_jaxprs_with_common_consts2",
+    "initial_style_jaxprs_with_shared_consts",
     "_abstractify",
     "_initial_style_jaxpr",
     "_input_type_to_tracers",
@@ -248,6 +250,21 @@ def sort_eqns(eqns: List[JaxprEqn], forced_order_primitives: Set[JaxprPrimitive]
     return [b.e for b in stable_toposort(boxes)]  # [4]
 
 
+def _abstractify_tracer(x: DynamicJaxprTracer):
+    return raise_to_shaped(x.aval)
+
+
+# Exact-type dispatch for the values most commonly abstractified during tracing. Other types go
+# through the generic JAX abstractification.
+_abstractify_handlers: Dict[type, Callable] = {DynamicJaxprTracer: _abstractify_tracer}
+
+
+def abstractify_many(vals: Sequence[Any]) -> tuple:
+    """Compute the shaped abstract values of a sequence of values. Equivalent to
+    ``tuple(map(_abstractify, vals))``, but dispatches on the exact type of each value first."""
+    return tuple(_abstractify_handlers.get(type(v), _abstractify)(v) for v in vals)
+
+
 def initial_style_jaxprs_with_common_consts1(
     funs: Sequence[Callable], in_tree, in_avals, primitive_name: str
 ):
@@ -270,7 +287,7 @@ def initial_style_jaxprs_with_common_consts2(jaxprs, all_consts):
     the fact that the tracing was already done elsewhere - and this is the only difference.
     """
 
-    all_const_avals = [map(_abstractify, consts) for consts in all_consts]
+    all_const_avals = [abstractify_many(consts) for consts in all_consts]
     for consts_avals in all_const_avals:
         for aval in consts_avals:
             assert not isinstance(
@@ -319,15 +336,52 @@ def initial_style_jaxprs_with_common_consts2(jaxprs, all_consts):
     return closed_jaxprs, consts
 
 
+def initial_style_jaxprs_with_shared_consts(jaxprs, all_consts):
+    """A version of `initial_style_jaxprs_with_common_consts2` which passes the constants captured
+    by more than one of the expressions (e.g. the same outer tracer) only once. Falls back to the
+    original algorithm if no constant is shared.
+    """
+    consts: List[Any] = []
+    const_positions: Dict[int, int] = {}
+    for branch_consts in all_consts:
+        if len(set(map(id, branch_consts))) != len(branch_consts):
+            return initial_style_jaxprs_with_common_consts2(jaxprs, all_consts)
+        for c in branch_consts:
+            if id(c) not in const_positions:
+                const_positions[id(c)] = len(consts)
+                consts.append(c)
+
+    if len(consts) == sum(map(len, all_consts)):
+        return initial_style_jaxprs_with_common_consts2(jaxprs, all_consts)
+
+    const_avals = abstractify_many(consts)
+    newvar = gensym(jaxprs, suffix="_")
+    closed_jaxprs = []
+    for jaxpr, branch_consts in zip(jaxprs, all_consts):
+        constvars = [None] * len(consts)
+        for var, c in zip(jaxpr.constvars, branch_consts):
+            constvars[const_positions[id(c)]] = var
+        constvars = [v if v is not None else newvar(a) for v, a in zip(constvars, const_avals)]
+        jaxpr = jaxpr.replace(constvars=constvars)
+        effects = make_jaxpr_effects(jaxpr.constvars, jaxpr.invars, jaxpr.outvars, jaxpr.eqns)
+        jaxpr = jaxpr.replace(effects=effects)
+        closed_jaxprs.append(ClosedJaxpr(convert_constvars_jaxpr(jaxpr), ()))
+    return closed_jaxprs, consts
+
+
 def deduce_avals(f: Callable, args, kwargs):
     """Wraps the callable ``f`` into a WrappedFun container accepting collapsed flatten arguments
     and returning expanded flatten results. Calculate input abstract values and output_tree promise.
     The promise must be called after the resulting wrapped function is evaluated."""
     # TODO: deprecate in favor of `deduce_signatures`
     flat_args, in_tree = tree_flatten((args, kwargs))
-    abstracted_axes = None
-    axes_specs = _flat_axes_specs(abstracted_axes, *args, **kwargs)
-    in_type = infer_lambda_input_type(axes_specs, flat_args)
+    return deduce_flat_avals(f, flat_args, in_tree)
+
+
+def deduce_flat_avals(f: Callable, flat_args, in_tree: PyTreeDef):
+    """A version of ``deduce_avals`` for the arguments which are already flattened, as in
+    ``tree_flatten((args, kwargs))``. Allows callers to flatten the arguments only once."""
+    in_type = infer_lambda_input_type(None, flat_args)
     in_avals, keep_inputs = unzip2(in_type)
     wf = wrap_init(f)
     wff, out_tree_promise = flatten_fun(wf, in_tree)
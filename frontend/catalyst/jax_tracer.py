@@ -14,6 +14,7 @@
 """This module contains functions tracing and lowering JAX code to MLIR.
 """
 
+import weakref
 from dataclasses import dataclass
 from functools import partial, reduce
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
@@ -21,6 +22,7 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import jax
 import jax.numpy as jnp
 import pennylane as qml
+from jax._src.api_util import shaped_abstractify
 from pennylane import QubitDevice, QubitUnitary, QueuingManager
 from pennylane.measurements import MeasurementProcess
 from pennylane.operation import AnyWires, Operation, Wires
@@ -33,6 +35,7 @@ from catalyst.jax_extras import (
     DynamicJaxprTrace,
     DynamicJaxprTracer,
     DynshapedClosedJaxpr,
+    Jaxpr,
     PyTreeDef,
     PyTreeRegistry,
     ShapedArray,
@@ -102,14 +105,115 @@ class Function:
         self.__name__ = fn.__name__
 
     def __call__(self, *args, **kwargs):
-        jaxpr, out_tree = make_jaxpr2(self.fn)(*args)
+        args_flat, args_tree = tree_flatten(args)
+        cache_key = get_signature_key(args_flat, args_tree)
+        entries = _get_traced_functions(self.fn) if cache_key is not None else None
+        traced = entries.get(cache_key) if entries is not None else None
 
-        def _eval_jaxpr(*args):
-            return jax.core.eval_jaxpr(jaxpr.jaxpr, jaxpr.consts, *args)
+        if traced is None:
+            jaxpr, out_tree = make_jaxpr2(self.fn)(*args)
+            traced = TracedFunction(jaxpr, (True,) * len(jaxpr.jaxpr.outvars), out_tree)
+            if entries is not None and not has_tracer_consts(jaxpr):
+                entries[cache_key] = traced
 
-        args, _ = jax.tree_util.tree_flatten(args)
-        retval = func_p.bind(wrap_init(_eval_jaxpr), *args, fn=self.fn)
-        return tree_unflatten(out_tree, retval)
+        return traced.bind(self.fn, args_flat)
+
+
+# Traced bodies of the callables wrapped by ``Function``, keyed by the callable and then by the
+# abstract signature of the call arguments. The body is lowered to a single MLIR function per
+# callable, so repeated calls with identical argument types only need to bind the stored expression.
+# Entries only live for the capture of a single program, see ``clear_traced_functions``.
+_traced_functions = weakref.WeakKeyDictionary()
+
+
+def clear_traced_functions():
+    """Forget the traced bodies of all the callables wrapped by ``Function``. The bodies embed the
+    bodies of the QNodes they call and may read global state, so they must not outlive the capture
+    of a program."""
+    _traced_functions.clear()
+
+
+def _get_traced_functions(fn: Callable) -> Optional[Dict]:
+    """Get the traced bodies of the callable, or ``None`` if they can not be stored."""
+    try:
+        return _traced_functions.setdefault(fn, {})
+    except TypeError:  # The callable is not weakly referenceable
+        return None
+
+
+@dataclass
+class TracedFunction:
+    """The result of tracing a function body, which can be bound again to arguments of the same
+    abstract signature without re-tracing the original Python function.
+
+    Args:
+        closed_jaxpr: JAXPR expression of the function body.
+        out_keep: Flags marking the explicit results of the JAXPR expression.
+        out_tree: PyTree shape of the function result.
+    """
+
+    closed_jaxpr: ClosedJaxpr
+    out_keep: Tuple[bool, ...]
+    out_tree: PyTreeDef
+
+    def __post_init__(self):
+        jaxpr, consts = self.closed_jaxpr.jaxpr, self.closed_jaxpr.consts
+        if all(self.out_keep):
+            fn = partial(eval_jaxpr, jaxpr, consts)
+        else:
+            fn = partial(_eval_jaxpr_explicit, jaxpr, consts, self.out_keep)
+
+        # Without transformations, the wrapped function holds no per-call state and can be bound
+        # any number of times.
+        self.wrapped_fn = wrap_init(fn)
+
+    def bind(self, fn: Callable, args_flat: List[Any]) -> Any:
+        """Emit a function call to the traced body with the given flat arguments.
+
+        Args:
+            fn: the Python callable the body was traced from, used to name the MLIR function.
+            args_flat: flat list of arguments matching the traced signature.
+
+        Returns:
+            The function results, in the traced PyTree shape.
+        """
+        res_flat = func_p.bind(self.wrapped_fn, *args_flat, fn=fn)
+        return tree_unflatten(self.out_tree, res_flat)
+
+
+def _eval_jaxpr_explicit(jaxpr: Jaxpr, consts: List[Any], out_keep: Tuple[bool, ...], *args):
+    """Evaluate the JAXPR expression, returning its explicit results only."""
+    res = eval_jaxpr(jaxpr, consts, *args)
+    return [r for r, k in zip(res, out_keep) if k]
+
+
+def get_signature_key(args_flat: List[Any], args_tree: PyTreeDef) -> Optional[Tuple]:
+    """Compute a hashable key describing the abstract signature of the flattened arguments. Traced
+    function bodies can only be re-used for arguments with the same key.
+
+    Args:
+        args_flat: flat list of arguments.
+        args_tree: PyTree shape of the arguments.
+
+    Returns:
+        The key or ``None`` if the signature can not be keyed, e.g. in the presence of dynamically
+        shaped arrays.
+    """
+    try:
+        avals = tuple(shaped_abstractify(a) for a in args_flat)
+    except TypeError:
+        return None
+
+    if not all(isinstance(d, int) for aval in avals for d in aval.shape):
+        return None
+
+    return (args_tree, avals)
+
+
+def has_tracer_consts(closed_jaxpr: ClosedJaxpr) -> bool:
+    """Check whether the constants of the JAXPR expression capture tracers of an enclosing trace,
+    which makes the expression unsuitable for re-use outside of that trace."""
+    return any(isinstance(c, jax.core.Tracer) for c in closed_jaxpr.consts)
 
 
 KNOWN_NAMED_OBS = (qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ, qml.Hadamard)
@@ -391,6 +495,10 @@ def lower_jaxpr_to_mlir(jaxpr, func_name):
     return mlir_module, ctx
 
 
+# Controlled operations which are bound as their base operation with native quantum control.
+_NATIVE_CONTROLLED_OPS = frozenset({Controlled, ControlledOp, ControlledQubitUnitary})
+
+
 def trace_quantum_tape(
     quantum_tape: QuantumTape,
     device: QubitDevice,
@@ -424,7 +532,7 @@ def trace_quantum_tape(
     def _bind_native_controlled_op(qrp, op, controlled_wires, controlled_values):
         # For named-controlled operations (e.g. CNOT, CY, CZ) - bind directly by name. For
         # `Controlled(OP)` bind OP with native quantum control syntax.
-        if op.__class__ in {Controlled, ControlledOp, ControlledQubitUnitary}:
+        if op.__class__ in _NATIVE_CONTROLLED_OPS:
             return _bind_native_controlled_op(qrp, op.base, op.control_wires, op.control_values)
         elif isinstance(op, QubitUnitary):
             qubits = qrp.extract(op.wires)
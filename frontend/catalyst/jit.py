@@ -24,7 +24,6 @@ import warnings
 
 import jax
 import jax.numpy as jnp
-import pennylane as qml
 from jax.interpreters import mlir
 from jax.tree_util import tree_flatten, tree_unflatten
 
@@ -45,7 +44,6 @@ from catalyst.utils.c_template import mlir_type_to_numpy_type
 from catalyst.utils.exceptions import CompileError
 from catalyst.utils.filesystem import WorkspaceManager
 from catalyst.utils.gen_mlir import inject_functions
-from catalyst.utils.patching import Patcher
 
 # Required for JAX tracer objects as PennyLane wires.
 # pylint: disable=unnecessary-lambda
@@ -213,9 +211,7 @@ class QJIT:
         dynamic_sig = get_abstract_signature(dynamic_args)
         full_sig = merge_static_args(dynamic_sig, args, static_argnums)
 
-        with Patcher(
-            (qml.QNode, "__call__", catalyst.pennylane_extensions.QFunc.__call__),
-        ):
+        with catalyst.pennylane_extensions.qnode_capture_scope():
             # TODO: improve PyTree handling
             jaxpr, treedef = trace_to_jaxpr(
                 self.user_function, static_argnums, abstracted_axes, full_sig, {}
@@ -21,16 +21,17 @@ while using :func:`~.qjit`.
 import copy
 import numbers
 import pathlib
+import weakref
 from collections.abc import Sequence, Sized
+from contextlib import contextmanager
 from functools import update_wrapper
-from typing import Any, Callable, Iterable, List, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
 import jax
 import jax.numpy as jnp
 import numpy as np
 import pennylane as qml
 from jax._src.api_util import shaped_abstractify
-from jax._src.lax.lax import _abstractify
 from jax._src.tree_util import (
     PyTreeDef,
     tree_flatten,
@@ -53,11 +54,12 @@ from catalyst.jax_extras import (  # infer_output_type3,
     ShapedArray,
     _initial_style_jaxpr,
     _input_type_to_tracers,
+    abstractify_many,
     convert_constvars_jaxpr,
-    deduce_avals,
+    deduce_flat_avals,
     get_implicit_and_explicit_flat_args,
     initial_style_jaxprs_with_common_consts1,
-    initial_style_jaxprs_with_common_consts2,
+    initial_style_jaxprs_with_shared_consts,
     new_inner_tracer,
     unzip2,
 )
@@ -82,7 +84,11 @@ from catalyst.jax_tracer import (
     HybridOp,
     HybridOpRegion,
     QRegPromise,
+    TracedFunction,
+    clear_traced_functions,
+    get_signature_key,
     has_nested_tapes,
+    has_tracer_consts,
     trace_quantum_function,
     trace_quantum_tape,
     unify_result_types,
@@ -94,8 +100,16 @@ from catalyst.tracing.contexts import (
     JaxTracingContext,
 )
 from catalyst.utils.exceptions import DifferentiableCompileError
+from catalyst.utils.patching import Patcher
 from catalyst.utils.runtime import extract_backend_info, get_lib_path
 
+# Abstract values carry no per-instance state, so a single quantum register type is shared by all
+# the nested regions that thread a register through.
+_ABSTRACT_QREG = AbstractQreg()
+
+# Values which can not be modified in place once captured in the closure of a branch function.
+_IMMUTABLE_CAPTURED_TYPES = (jax.Array, jax.core.Tracer, numbers.Number, str, bytes, type(None))
+
 
 def _check_no_measurements(tape: QuantumTape) -> None:
     """Check the nested quantum tape for the absense of quantum measurements of any kind"""
@@ -155,6 +169,12 @@ class QFunc:
         return extract_backend_info(device)
 
     def __call__(self, *args, **kwargs):
+        args_flat, args_tree = tree_flatten((args, {}))
+        cache_key = None if kwargs else get_signature_key(args_flat, args_tree)
+        traced = QFunc._lookup_traced(self, cache_key)
+        if traced is not None:
+            return traced.bind(self, args_flat)
+
         qnode = None
         if isinstance(self, qml.QNode):
             qnode = self
@@ -173,14 +193,66 @@ class QFunc:
             args_expanded = get_implicit_and_explicit_flat_args(None, *args)
             res_expanded = eval_jaxpr(closed_jaxpr.jaxpr, closed_jaxpr.consts, *args_expanded)
             _, out_keep = unzip2(out_type)
+            if cache_key is not None and not has_tracer_consts(closed_jaxpr):
+                entry = TracedFunction(closed_jaxpr, out_keep, out_tree)
+                QFunc._store_traced(self, cache_key, entry)
             res_flat = [r for r, k in zip(res_expanded, out_keep) if k]
             return tree_unflatten(out_tree, res_flat)
 
-        flattened_fun, _, _, out_tree_promise = deduce_avals(_eval_quantum, args, {})
-        args_flat = tree_flatten(args)[0]
+        flattened_fun, _, _, out_tree_promise = deduce_flat_avals(
+            _eval_quantum, args_flat, args_tree
+        )
         res_flat = func_p.bind(flattened_fun, *args_flat, fn=self)
         return tree_unflatten(out_tree_promise(), res_flat)
 
+    @staticmethod
+    def _lookup_traced(qfunc, cache_key) -> Optional[TracedFunction]:
+        """Find the traced body of the quantum function for the given argument signature. Entries
+        are discarded as soon as the device of the quantum function gets replaced."""
+        if cache_key is None or qfunc not in _traced_qfunc_cache:
+            return None
+        device, entries = _traced_qfunc_cache[qfunc]
+        if device is not qfunc.device:
+            del _traced_qfunc_cache[qfunc]
+            return None
+        return entries.get(cache_key)
+
+    @staticmethod
+    def _store_traced(qfunc, cache_key, traced: TracedFunction) -> None:
+        """Remember the traced body of the quantum function for the given argument signature."""
+        if qfunc not in _traced_qfunc_cache:
+            _traced_qfunc_cache[qfunc] = (qfunc.device, {})
+        _traced_qfunc_cache[qfunc][1][cache_key] = traced
+
+
+# Traced quantum function bodies, keyed by the quantum function object and then by the abstract
+# signature of the call arguments. Tracing the same quantum function again with identical argument
+# types would produce the same JAXPR, so repeated calls only need to bind the stored expression.
+# Entries only live for the capture of a single program, see ``qnode_capture_scope``.
+_traced_qfunc_cache = weakref.WeakKeyDictionary()
+
+
+@contextmanager
+def qnode_capture_scope(*patches):
+    """Capture the QNodes called within the enclosed program capture as quantum functions.
+
+    The re-use of traced quantum function and ``Function`` bodies is limited to the capture.
+    Besides the argument types, the bodies depend on state which may change between captures,
+    e.g. the device shots, the backend information or the transforms of the QNode.
+
+    Args:
+        *patches: additional attribute replacements applied during the capture, as accepted by
+            :class:`~.Patcher`
+    """
+    _traced_qfunc_cache.clear()
+    clear_traced_functions()
+    try:
+        with Patcher((qml.QNode, "__call__", QFunc.__call__), *patches):
+            yield
+    finally:
+        _traced_qfunc_cache.clear()
+        clear_traced_functions()
+
 
 def qfunc(device):
     """A Device specific quantum function.
@@ -227,7 +299,7 @@ def _make_jaxpr_check_differentiable(f: Differentiable, grad_params: GradParams,
     return the output tree."""
     method = grad_params.method
     jaxpr, shape = jax.make_jaxpr(f, return_shape=True)(*args)
-    _, out_tree = tree_flatten(shape)
+    out_tree = tree_structure(shape)
     assert len(jaxpr.eqns) == 1, "Expected jaxpr consisting of a single function call."
     assert jaxpr.eqns[0].primitive == func_p, "Expected jaxpr consisting of a single function call."
 
@@ -355,11 +427,13 @@ def _check_grad_params(
         argnum_list = argnum
     else:
         raise ValueError(f"argnum should be integer or a list of integers, not {argnum}")
-    # Compute the argnums of the pytree arg
-    total_argnums = list(range(0, len_flatten_args))
-    argnum_unflatten = tree_unflatten(in_tree, total_argnums)
-    argnum_selected = [argnum_unflatten[i] for i in argnum_list]
-    argnum_expanded, _ = tree_flatten(argnum_selected)
+    # Compute the argnums of the pytree arg from the leaf ranges of its top-level children
+    leaf_ranges, num_leaves = [], 0
+    for arg_tree in in_tree.children():
+        leaf_ranges.append(range(num_leaves, num_leaves + arg_tree.num_leaves))
+        num_leaves += arg_tree.num_leaves
+    assert num_leaves == len_flatten_args, "Argument tree does not match the flat arguments"
+    argnum_expanded = [i for idx in argnum_list for i in leaf_ranges[idx]]
     scalar_argnum = isinstance(argnum, int) or argnum is None
     return GradParams(method, scalar_out, h, argnum_list, scalar_argnum, argnum_expanded)
 
@@ -424,7 +498,7 @@ class Grad:
             )
             jaxpr, out_tree = _make_jaxpr_check_differentiable(fn, grad_params, *args)
             args_argnum = tuple(args[i] for i in grad_params.argnum)
-            _, in_tree = tree_flatten(args_argnum)
+            in_tree = tree_structure(args_argnum)
 
             # It always returns list as required by catalyst control-flows
             results = grad_p.bind(*args_data, jaxpr=jaxpr, fn=fn, grad_params=grad_params)
@@ -803,12 +877,10 @@ def vjp(f: DifferentiableLike, params, cotangents, *, method=None, h=None, argnu
         grad_params = _check_grad_params(method, scalar_out, h, argnum, len(args_flatten), in_tree)
 
         args_argnum = tuple(params[i] for i in grad_params.argnum)
-        _, in_tree = tree_flatten(args_argnum)
+        in_tree = tree_structure(args_argnum)
 
         jaxpr, out_tree = _make_jaxpr_check_differentiable(fn, grad_params, *params)
 
-        cotangents, _ = tree_flatten(cotangents)
-
         results = vjp_p.bind(
             *args_flatten, *cotangents_flatten, jaxpr=jaxpr, fn=fn, grad_params=grad_params
         )
@@ -953,10 +1025,50 @@ def _check_cond_same_shapes(trees: List[PyTreeDef], avals: List[List[Any]]) -> N
     assert len(trees) == len(avals), f"Input trees ({trees}) don't match input avals ({avals})"
     expected_tree = trees[0]
     for tree in list(trees)[1:]:
-        if tree != expected_tree:
+        if tree is not expected_tree and tree != expected_tree:
             raise TypeError("Conditional requires consistent return types across all branches")
 
 
+def _trace_classical_region(
+    ctx: JaxTracingContext, fn: Callable, flat_args, in_tree: PyTreeDef
+) -> Tuple[HybridOpRegion, Callable[[], PyTreeDef]]:
+    """Perform the classical tracing of a nested region, recording its quantum operations on a new
+    quantum tape. The arguments are passed flattened, as in ``tree_flatten((args, {}))``.
+
+    Returns:
+        region: the traced region.
+        out_tree: a promise of the PyTree shape of the ``fn`` results.
+    """
+    quantum_tape = QuantumTape()
+    with EvaluationContext.frame_tracing_context(ctx) as inner_trace:
+        wffa, in_avals, _, out_tree = deduce_flat_avals(fn, flat_args, in_tree)
+        arg_classical_tracers = _input_type_to_tracers(inner_trace.new_arg, in_avals)
+        with QueuingManager.stop_recording(), quantum_tape:
+            res_classical_tracers = [
+                inner_trace.full_raise(t) for t in wffa.call_wrapped(*arg_classical_tracers)
+            ]
+    region = HybridOpRegion(inner_trace, quantum_tape, arg_classical_tracers, res_classical_tracers)
+    return region, out_tree
+
+
+def _trace_quantum_region(ctx: JaxTracingContext, device, region: HybridOpRegion):
+    """Perform the quantum tracing of a nested region, threading the quantum register through it as
+    the last argument and result.
+
+    Returns:
+        jaxpr: the JAXPR expression of the region.
+        consts: the constants captured by the region.
+    """
+    with EvaluationContext.frame_tracing_context(ctx, region.trace):
+        qreg_in = _input_type_to_tracers(region.trace.new_arg, [_ABSTRACT_QREG])[0]
+        qrp_out = trace_quantum_tape(region.quantum_tape, device, qreg_in, ctx, region.trace)
+        qreg_out = qrp_out.actualize()
+        jaxpr, _, consts = ctx.frames[region.trace].to_jaxpr2(
+            region.res_classical_tracers + [qreg_out]
+        )
+    return jaxpr, consts
+
+
 class ForLoop(HybridOp):
     """PennyLane ForLoop Operation."""
 
@@ -964,15 +1076,7 @@ class ForLoop(HybridOp):
 
     def trace_quantum(self, ctx, device, trace, qrp) -> QRegPromise:
         op = self
-        inner_trace = op.regions[0].trace
-        inner_tape = op.regions[0].quantum_tape
-        res_classical_tracers = op.regions[0].res_classical_tracers
-
-        with EvaluationContext.frame_tracing_context(ctx, inner_trace):
-            qreg_in = _input_type_to_tracers(inner_trace.new_arg, [AbstractQreg()])[0]
-            qrp_out = trace_quantum_tape(inner_tape, device, qreg_in, ctx, inner_trace)
-            qreg_out = qrp_out.actualize()
-            jaxpr, _, consts = ctx.frames[inner_trace].to_jaxpr2(res_classical_tracers + [qreg_out])
+        jaxpr, consts = _trace_quantum_region(ctx, device, op.regions[0])
 
         step = op.in_classical_tracers[2]
         apply_reverse_transform = isinstance(step, int) and step < 0
@@ -1018,19 +1122,11 @@ class Cond(HybridOp):
         jaxprs, consts = [], []
         op = self
         for region in op.regions:
-            with EvaluationContext.frame_tracing_context(ctx, region.trace):
-                qreg_in = _input_type_to_tracers(region.trace.new_arg, [AbstractQreg()])[0]
-                qrp_out = trace_quantum_tape(
-                    region.quantum_tape, device, qreg_in, ctx, region.trace
-                )
-                qreg_out = qrp_out.actualize()
-                jaxpr, _, const = ctx.frames[region.trace].to_jaxpr2(
-                    region.res_classical_tracers + [qreg_out]
-                )
-                jaxprs.append(jaxpr)
-                consts.append(const)
+            jaxpr, const = _trace_quantum_region(ctx, device, region)
+            jaxprs.append(jaxpr)
+            consts.append(const)
 
-        jaxprs2, combined_consts = initial_style_jaxprs_with_common_consts2(jaxprs, consts)
+        jaxprs2, combined_consts = initial_style_jaxprs_with_shared_consts(jaxprs, consts)
 
         qreg = qrp.actualize()
         qrp2 = QRegPromise(
@@ -1053,19 +1149,10 @@ class WhileLoop(HybridOp):
         cond_trace = self.regions[0].trace
         res_classical_tracers = self.regions[0].res_classical_tracers
         with EvaluationContext.frame_tracing_context(ctx, cond_trace):
-            _input_type_to_tracers(cond_trace.new_arg, [AbstractQreg()])
+            _input_type_to_tracers(cond_trace.new_arg, [_ABSTRACT_QREG])
             cond_jaxpr, _, cond_consts = ctx.frames[cond_trace].to_jaxpr2(res_classical_tracers)
 
-        body_trace = self.regions[1].trace
-        body_tape = self.regions[1].quantum_tape
-        res_classical_tracers = self.regions[1].res_classical_tracers
-        with EvaluationContext.frame_tracing_context(ctx, body_trace):
-            qreg_in = _input_type_to_tracers(body_trace.new_arg, [AbstractQreg()])[0]
-            qrp_out = trace_quantum_tape(body_tape, device, qreg_in, ctx, body_trace)
-            qreg_out = qrp_out.actualize()
-            body_jaxpr, _, body_consts = ctx.frames[body_trace].to_jaxpr2(
-                res_classical_tracers + [qreg_out]
-            )
+        body_jaxpr, body_consts = _trace_quantum_region(ctx, device, self.regions[1])
 
         qreg = qrp.actualize()
         qrp2 = QRegPromise(
@@ -1089,16 +1176,7 @@ class Adjoint(HybridOp):
 
     def trace_quantum(self, ctx, device, trace, qrp) -> QRegPromise:
         op = self
-        body_trace = op.regions[0].trace
-        body_tape = op.regions[0].quantum_tape
-        res_classical_tracers = op.regions[0].res_classical_tracers
-        with EvaluationContext.frame_tracing_context(ctx, body_trace):
-            qreg_in = _input_type_to_tracers(body_trace.new_arg, [AbstractQreg()])[0]
-            qrp_out = trace_quantum_tape(body_tape, device, qreg_in, ctx, body_trace)
-            qreg_out = qrp_out.actualize()
-            body_jaxpr, _, body_consts = ctx.frames[body_trace].to_jaxpr2(
-                res_classical_tracers + [qreg_out]
-            )
+        body_jaxpr, body_consts = _trace_quantum_region(ctx, device, op.regions[0])
 
         qreg = qrp.actualize()
         args, args_tree = tree_flatten((body_consts, op.in_classical_tracers, [qreg]))
@@ -1239,6 +1317,11 @@ def qctrl_distribute(
     return QuantumTape(ops2, tape.measurements)
 
 
+def _all_identical(xs: Sequence, ys: Sequence) -> bool:
+    """Check whether two sequences hold the very same objects."""
+    return len(xs) == len(ys) and all(x is y for x, y in zip(xs, ys))
+
+
 class CondCallable:
     """User-facing wrapper provoding "else_if" and "otherwise" public methods.
     Some code in this class has been adapted from the cond implementation in the JAX project at
@@ -1251,7 +1334,8 @@ class CondCallable:
     def __init__(self, pred, true_fn):
         self.preds = [pred]
         self.branch_fns = [true_fn]
-        self.otherwise_fn = lambda: None
+        self.otherwise_fn = CondCallable._default_otherwise_fn
+        self._classical_trace = None
 
     def else_if(self, pred):
         """
@@ -1291,38 +1375,92 @@ class CondCallable:
         self.otherwise_fn = otherwise_fn
         return self
 
+    @staticmethod
+    def _default_otherwise_fn():
+        """The 'otherwise' branch of conditionals which do not define one. It is shared by all the
+        conditionals, so that in classical tracing contexts JAX's jaxpr cache traces it only once
+        for a given signature. Quantum tracing contexts still trace it for every conditional."""
+        return None
+
     def _call_with_quantum_ctx(self, ctx):
         outer_trace = ctx.trace
         in_classical_tracers = self.preds
         regions: List[HybridOpRegion] = []
 
         out_trees, out_avals = [], []
+        flat_args, in_tree = tree_flatten(([], {}))
         for branch in self.branch_fns + [self.otherwise_fn]:
-            quantum_tape = QuantumTape()
-            with EvaluationContext.frame_tracing_context(ctx) as inner_trace:
-                wffa, _, _, out_tree = deduce_avals(branch, [], {})
-                with QueuingManager.stop_recording(), quantum_tape:
-                    res_classical_tracers = [inner_trace.full_raise(t) for t in wffa.call_wrapped()]
-            regions.append(HybridOpRegion(inner_trace, quantum_tape, [], res_classical_tracers))
+            region, out_tree = _trace_classical_region(ctx, branch, flat_args, in_tree)
+            regions.append(region)
             out_trees.append(out_tree())
-            out_avals.append(res_classical_tracers)
+            out_avals.append(region.res_classical_tracers)
 
         _check_cond_same_shapes(out_trees, out_avals)
-        res_avals = list(map(shaped_abstractify, res_classical_tracers))
+        res_avals = list(map(shaped_abstractify, region.res_classical_tracers))
         out_classical_tracers = [new_inner_tracer(outer_trace, aval) for aval in res_avals]
         Cond(in_classical_tracers, out_classical_tracers, regions)
         return tree_unflatten(out_tree(), out_classical_tracers)
 
-    def _call_with_classical_ctx(self):
+    def _captured_values(self) -> Optional[List[Any]]:
+        """Collect the values captured in the closures of the branch functions. Returns ``None``
+        if a closure can not be inspected or holds a value which could be modified in place."""
+        captured = []
+        for fn in (*self.branch_fns, self.otherwise_fn):
+            for cell in getattr(fn, "__closure__", None) or ():
+                try:
+                    value = cell.cell_contents
+                except ValueError:  # Empty closure cell
+                    return None
+                if not isinstance(value, _IMMUTABLE_CAPTURED_TYPES):
+                    return None
+                captured.append(value)
+        return captured
+
+    def _trace_classical_branches(self):
+        """Trace the branch functions into JAXPR expressions with unified result types. The
+        expressions are memoized for as long as the branch functions and their captured values
+        remain the same objects. The memo holds on to these objects, so that their identities can
+        not be re-used by other objects in the meantime."""
+        fns = (*self.branch_fns, self.otherwise_fn)
+        captured = self._captured_values()
+        if captured is not None and self._classical_trace is not None:
+            memo_fns, memo_captured, traced = self._classical_trace
+            if _all_identical(memo_fns, fns) and _all_identical(memo_captured, captured):
+                return traced
+
         args, args_tree = tree_flatten([])
-        args_avals = tuple(map(_abstractify, args))
+        args_avals = abstractify_many(args)
         branch_jaxprs, consts, out_trees = initial_style_jaxprs_with_common_consts1(
             (*self.branch_fns, self.otherwise_fn), args_tree, args_avals, "cond"
         )
         _check_cond_same_shapes(out_trees, [j.out_avals for j in branch_jaxprs])
         branch_jaxprs = unify_result_types(branch_jaxprs)
-        out_classical_tracers = cond_p.bind(*(self.preds + consts), branch_jaxprs=branch_jaxprs)
-        return tree_unflatten(out_trees[0], out_classical_tracers)
+
+        traced = (branch_jaxprs, consts, out_trees[0])
+        if captured is not None:
+            self._classical_trace = (fns, captured, traced)
+        return traced
+
+    def _constant_branch_index(self) -> Optional[int]:
+        """Find the branch selected by the predicates if it is known at compile time, i.e. if the
+        predicates preceding the first satisfied one are not traced. Returns ``None`` otherwise."""
+        for i, pred in enumerate(self.preds):
+            if isinstance(pred, jax.core.Tracer):
+                return None
+            if pred:
+                return i
+        return len(self.preds)
+
+    def _call_with_classical_ctx(self):
+        branch_jaxprs, consts, out_tree = self._trace_classical_branches()
+        branch_index = self._constant_branch_index()
+        if branch_index is not None:
+            # All the branches are still traced to check and unify their result types, but only the
+            # selected one is inlined.
+            out_classical_tracers = jax.core.jaxpr_as_fun(branch_jaxprs[branch_index])(*consts)
+        else:
+            out_classical_tracers = cond_p.bind(*(self.preds + consts), branch_jaxprs=branch_jaxprs)
+        return tree_unflatten(out_tree, out_classical_tracers)
 
     def _call_during_interpretation(self):
         for pred, branch_fn in zip(self.preds, self.branch_fns):
@@ -1597,43 +1735,22 @@ def for_loop(lower_bound, upper_bound, step):
     def _body_query(body_fn):
         def _call_handler(*init_state):
             def _call_with_quantum_ctx(ctx: JaxTracingContext):
-                quantum_tape = QuantumTape()
                 outer_trace = ctx.trace
-                with EvaluationContext.frame_tracing_context(ctx) as inner_trace:
-                    in_classical_tracers = [
-                        lower_bound,
-                        upper_bound,
-                        step,
-                        lower_bound,
-                    ] + tree_flatten(init_state)[0]
-                    wffa, in_avals, _, body_tree = deduce_avals(
-                        body_fn, [lower_bound] + list(init_state), {}
-                    )
-                    arg_classical_tracers = _input_type_to_tracers(inner_trace.new_arg, in_avals)
-                    with QueuingManager.stop_recording(), quantum_tape:
-                        res_classical_tracers = [
-                            inner_trace.full_raise(t)
-                            for t in wffa.call_wrapped(*arg_classical_tracers)
-                        ]
-
-                res_avals = list(map(shaped_abstractify, res_classical_tracers))
+                # The iteration index is a leaf, so it is the first of the flat body arguments.
+                flat_args, in_tree = tree_flatten(([lower_bound, *init_state], {}))
+                in_classical_tracers = [lower_bound, upper_bound, step] + flat_args
+                body_region, body_tree = _trace_classical_region(ctx, body_fn, flat_args, in_tree)
+
+                res_avals = list(map(shaped_abstractify, body_region.res_classical_tracers))
                 out_classical_tracers = [new_inner_tracer(outer_trace, aval) for aval in res_avals]
-                ForLoop(
-                    in_classical_tracers,
-                    out_classical_tracers,
-                    [
-                        HybridOpRegion(
-                            inner_trace, quantum_tape, arg_classical_tracers, res_classical_tracers
-                        )
-                    ],
-                )
+                ForLoop(in_classical_tracers, out_classical_tracers, [body_region])
 
                 return tree_unflatten(body_tree(), out_classical_tracers)
 
             def _call_with_classical_ctx():
                 iter_arg = lower_bound
                 init_vals, in_tree = tree_flatten((iter_arg, *init_state))
-                init_avals = tuple(_abstractify(val) for val in init_vals)
+                init_avals = abstractify_many(init_vals)
                 body_jaxpr, body_consts, body_tree = _initial_style_jaxpr(
                     body_fn, in_tree, init_avals, "for_loop"
                 )
@@ -1740,10 +1857,12 @@ def while_loop(cond_fn):
         def _call_handler(*init_state):
             def _call_with_quantum_ctx(ctx: JaxTracingContext):
                 outer_trace = ctx.trace
-                in_classical_tracers, _ = tree_flatten(init_state)
+                in_classical_tracers, in_tree = tree_flatten((init_state, {}))
 
                 with EvaluationContext.frame_tracing_context(ctx) as cond_trace:
-                    cond_wffa, cond_in_avals, _, cond_tree = deduce_avals(cond_fn, init_state, {})
+                    cond_wffa, cond_in_avals, _, cond_tree = deduce_flat_avals(
+                        cond_fn, in_classical_tracers, in_tree
+                    )
                     arg_classical_tracers = _input_type_to_tracers(
                         cond_trace.new_arg, cond_in_avals
                     )
@@ -1757,20 +1876,11 @@ def while_loop(cond_fn):
 
                 _check_single_bool_value(cond_tree(), res_classical_tracers)
 
-                with EvaluationContext.frame_tracing_context(ctx) as body_trace:
-                    wffa, in_avals, _, body_tree = deduce_avals(body_fn, init_state, {})
-                    arg_classical_tracers = _input_type_to_tracers(body_trace.new_arg, in_avals)
-                    quantum_tape = QuantumTape()
-                    with QueuingManager.stop_recording(), quantum_tape:
-                        res_classical_tracers = [
-                            body_trace.full_raise(t)
-                            for t in wffa.call_wrapped(*arg_classical_tracers)
-                        ]
-                    body_region = HybridOpRegion(
-                        body_trace, quantum_tape, arg_classical_tracers, res_classical_tracers
-                    )
+                body_region, body_tree = _trace_classical_region(
+                    ctx, body_fn, in_classical_tracers, in_tree
+                )
 
-                res_avals = list(map(shaped_abstractify, res_classical_tracers))
+                res_avals = list(map(shaped_abstractify, body_region.res_classical_tracers))
                 out_classical_tracers = [new_inner_tracer(outer_trace, aval) for aval in res_avals]
 
                 WhileLoop(in_classical_tracers, out_classical_tracers, [cond_region, body_region])
@@ -1778,7 +1888,7 @@ def while_loop(cond_fn):
 
             def _call_with_classical_ctx():
                 init_vals, in_tree = tree_flatten(init_state)
-                init_avals = tuple(_abstractify(val) for val in init_vals)
+                init_avals = abstractify_many(init_vals)
                 cond_jaxpr, cond_consts, cond_tree = _initial_style_jaxpr(
                     cond_fn, in_tree, init_avals, "while_cond"
                 )
@@ -1999,8 +2109,8 @@ def adjoint(f: Union[Callable, Operator]) -> Union[Callable, Operator]:
         )
         ctx = EvaluationContext.get_main_tracing_context()
         with EvaluationContext.frame_tracing_context(ctx) as inner_trace:
-            in_classical_tracers, _ = tree_flatten((args, kwargs))
-            wffa, in_avals, _, _ = deduce_avals(_callee, args, kwargs)
+            in_classical_tracers, in_tree = tree_flatten((args, kwargs))
+            wffa, in_avals, _, _ = deduce_flat_avals(_callee, in_classical_tracers, in_tree)
             arg_classical_tracers = _input_type_to_tracers(inner_trace.new_arg, in_avals)
             quantum_tape = QuantumTape()
             with QueuingManager.stop_recording(), quantum_tape:
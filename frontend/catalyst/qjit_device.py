@@ -20,6 +20,32 @@ from catalyst.utils.exceptions import CompileError
 from catalyst.utils.patching import Patcher
 
 
+def _decomp_to_unitary(self, *_args, **_kwargs):
+    try:
+        mat = self.matrix()
+    except Exception as e:
+        raise CompileError(
+            f"Operation {self} could not be decomposed, it might be unsupported."
+        ) from e
+    return [qml.QubitUnitary(mat, wires=self.wires)]
+
+
+def _has_decomposition(_self):
+    return True
+
+
+# Fallback for controlled gates that won't decompose successfully.
+# Doing so before rather than after decomposition is generally a trade-off. For low
+# numbers of qubits, a unitary gate might be faster, while for large qubit numbers prior
+# decomposition is generally faster.
+# At the moment, bypassing decomposition for controlled gates will generally have a higher
+# success rate, as complex decomposition paths can fail to trace (c.f. PL #3521, #3522).
+_CONTROLLED_PATCHES = (
+    (qml.ops.Controlled, "has_decomposition", _has_decomposition),
+    (qml.ops.Controlled, "decomposition", _decomp_to_unitary),
+)
+
+
 class QJITDevice(qml.QubitDevice):
     """QJIT device.
 
@@ -42,9 +68,9 @@ class QJITDevice(qml.QubitDevice):
     version = "0.0.1"
     author = ""
 
-    # These must be present even if empty.
-    operations = []
-    observables = []
+    # These must be present even if empty. They are only used for membership tests.
+    operations = frozenset()
+    observables = frozenset()
 
     operations_supported_by_QIR_runtime = {
         "Identity",
@@ -80,6 +106,20 @@ class QJITDevice(qml.QubitDevice):
         "GlobalPhase",
     }
 
+    gates_to_be_decomposed_if_controlled = frozenset(
+        {
+            "Identity",
+            "CNOT",
+            "CY",
+            "CZ",
+            "CSWAP",
+            "CRX",
+            "CRY",
+            "CRZ",
+            "CRot",
+        }
+    )
+
     @staticmethod
     def _get_operations_to_convert_to_matrix(_config):
         # We currently override and only set a few gates to preserve existing behaviour.
@@ -106,42 +146,32 @@ class QJITDevice(qml.QubitDevice):
         """Override the set of supported operations."""
         native_gates = set(config["operators"]["gates"][0]["native"])
         qir_gates = QJITDevice.operations_supported_by_QIR_runtime
-        supported_native_gates = list(set.intersection(native_gates, qir_gates))
-        QJITDevice.operations = supported_native_gates
+        operations = set.intersection(native_gates, qir_gates)
 
         # These are added unconditionally.
-        QJITDevice.operations += ["Cond", "WhileLoop", "ForLoop"]
+        operations.update(["Cond", "WhileLoop", "ForLoop"])
 
         if QJITDevice._check_mid_circuit_measurement(config):  # pragma: no branch
-            QJITDevice.operations += ["MidCircuitMeasure"]
+            operations.add("MidCircuitMeasure")
 
         if QJITDevice._check_adjoint(config):
-            QJITDevice.operations += ["Adjoint"]
+            operations.add("Adjoint")
 
         if QJITDevice._check_quantum_control(config):  # pragma: nocover
             # TODO: Once control is added on the frontend.
-            gates_to_be_decomposed_if_controlled = [
-                "Identity",
-                "CNOT",
-                "CY",
-                "CZ",
-                "CSWAP",
-                "CRX",
-                "CRY",
-                "CRZ",
-                "CRot",
-            ]
             native_controlled_gates = ["ControlledQubitUnitary"] + [
                 f"C({gate})"
                 for gate in native_gates
-                if gate not in gates_to_be_decomposed_if_controlled
+                if gate not in QJITDevice.gates_to_be_decomposed_if_controlled
             ]
-            QJITDevice.operations += native_controlled_gates
+            operations.update(native_controlled_gates)
+
+        QJITDevice.operations = frozenset(operations)
 
     @staticmethod
     def _set_supported_observables(config):
         """Override the set of supported observables."""
-        QJITDevice.observables = config["operators"]["observables"]
+        QJITDevice.observables = frozenset(config["operators"]["observables"])
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -162,6 +192,12 @@ class QJITDevice(qml.QubitDevice):
         self.backend_kwargs = backend_kwargs if backend_kwargs else {}
         super().__init__(wires=wires, shots=shots)
 
+        decompose_to_qubit_unitary = QJITDevice._get_operations_to_convert_to_matrix(config)
+        self._expansion_patches = _CONTROLLED_PATCHES + tuple(
+            (getattr(qml, gate), "decomposition", _decomp_to_unitary)
+            for gate in decompose_to_qubit_unitary
+        )
+
     def apply(self, operations, **kwargs):
         """
         Raises: RuntimeError
@@ -189,31 +225,12 @@ class QJITDevice(qml.QubitDevice):
         if any(isinstance(op, MidMeasureMP) for op in circuit.operations):
             raise CompileError("Must use 'measure' from Catalyst instead of PennyLane.")
 
-        decompose_to_qubit_unitary = QJITDevice._get_operations_to_convert_to_matrix(self.config)
-
-        def _decomp_to_unitary(self, *_args, **_kwargs):
-            try:
-                mat = self.matrix()
-            except Exception as e:
-                raise CompileError(
-                    f"Operation {self} could not be decomposed, it might be unsupported."
-                ) from e
-            return [qml.QubitUnitary(mat, wires=self.wires)]
-
-        # Fallback for controlled gates that won't decompose successfully.
-        # Doing so before rather than after decomposition is generally a trade-off. For low
-        # numbers of qubits, a unitary gate might be faster, while for large qubit numbers prior
-        # decomposition is generally faster.
-        # At the moment, bypassing decomposition for controlled gates will generally have a higher
-        # success rate, as complex decomposition paths can fail to trace (c.f. PL #3521, #3522).
-        overriden_methods = [  # pragma: no cover
-            (qml.ops.Controlled, "has_decomposition", lambda self: True),
-            (qml.ops.Controlled, "decomposition", _decomp_to_unitary),
-        ]
-        for gate in decompose_to_qubit_unitary:
-            overriden_methods.append((getattr(qml, gate), "decomposition", _decomp_to_unitary))
-
-        with Patcher(*overriden_methods):
+        # Tapes of nested regions, e.g. a conditional branch applying a single gate, usually only
+        # contain supported operations and no measurements, in which case there is nothing to do.
+        if not circuit.measurements and all(map(self.stopping_condition, circuit.operations)):
+            return circuit
+
+        with Patcher(*self._expansion_patches):
             expanded_tape = super().default_expand_fn(circuit, max_expansion)
 
         self.check_validity(expanded_tape.operations, [])
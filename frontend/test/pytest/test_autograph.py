@@ -258,6 +258,41 @@ class TestIntegration:
         assert check_cache(inner2.func)
         assert fn(np.pi) == -2
 
+    def test_repeated_qnode(self):
+        """Test that a QNode called repeatedly from converted code is only traced once."""
+
+        num_traces = 0
+
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def inner(x):
+            nonlocal num_traces
+            num_traces += 1
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        @qjit(autograph=True)
+        def fn(x: float):
+            return inner(x) + inner(2 * x)
+
+        assert check_cache(inner.func)
+        assert np.isclose(fn(np.pi), 0)
+        assert num_traces == 1
+
+    def test_qnode_keyword_argument(self):
+        """Test a QNode called from converted code with a keyword tracer argument."""
+
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def inner(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        @qjit(autograph=True)
+        def fn(x: float):
+            return inner(x=x) + inner(x=2 * x)
+
+        assert check_cache(inner.func)
+        assert np.isclose(fn(np.pi), 0)
+
     def test_nested_qnode(self):
         """Test autograph on a QNode called from within another QNode."""
 
@@ -17,6 +17,7 @@ import pennylane as qml
 import pytest
 
 from catalyst import cond, measure, qjit
+from catalyst.jax_extras import initial_style_jaxprs_with_common_consts1
 
 # pylint: disable=missing-function-docstring
 
@@ -53,6 +54,25 @@ class TestCondToJaxpr:
 
         assert asline(expected) == asline(circuit.jaxpr)
 
+    def test_constant_cond_to_jaxpr(self):
+        """Check that a conditional with a predicate known at compile time is inlined."""
+
+        @qjit
+        def circuit(n: int):
+            @cond(False)
+            def cond_fn():
+                return n**2
+
+            @cond_fn.otherwise
+            def cond_fn():
+                return n**3
+
+            return cond_fn()
+
+        assert "cond" not in str(circuit.jaxpr)
+        assert "integer_pow[y=3]" in str(circuit.jaxpr)
+        assert circuit(2) == 8
+
 
 class TestCond:
     """Test suite for the Cond functionality in Catalyst."""
@@ -261,6 +281,23 @@ class TestCond:
         ):
             qjit(circuit)
 
+    def test_branch_return_no_otherwise_classical(self):
+        """Test that an exception is raised when the true branch returns a value but no else branch
+        is provided, given a classical tracing context (no QNode).
+        """
+
+        def circuit():
+            @cond(True)
+            def cond_fn():
+                return 1
+
+            return cond_fn()
+
+        with pytest.raises(
+            TypeError, match="Conditional requires consistent return types across all branches"
+        ):
+            qjit(circuit)
+
     def test_branch_return_promotion_classical(self):
         """Test that an exception is raised when the true branch returns a different type than the
         else branch, given a classical tracing context (no QNode).
@@ -319,6 +356,64 @@ class TestCond:
         assert circuit(False) == 0
         assert circuit(True) == 1
 
+    def test_branches_share_captured_tracer(self, backend):
+        """Test that a tracer captured by several branches is passed to the conditional once."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(pred: bool, x: float):
+            @cond(pred)
+            def conditional_rotation():
+                qml.RX(x, wires=0)
+
+            @conditional_rotation.otherwise
+            def conditional_rotation():
+                qml.RX(2 * x, wires=0)
+
+            conditional_rotation()
+
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.isclose(circuit(True, 0.4), np.cos(0.4))
+        assert np.isclose(circuit(False, 0.4), np.cos(0.8))
+
+        def find_eqn(jaxpr, name):
+            for eqn in jaxpr.eqns:
+                if eqn.primitive.name == name:
+                    return eqn
+                for param in eqn.params.values():
+                    if hasattr(param, "eqns"):
+                        found = find_eqn(param, name)
+                        if found is not None:
+                            return found
+            return None
+
+        qnode_jaxpr = find_eqn(circuit.jaxpr.jaxpr, "func").params["call_jaxpr"]
+        cond_eqn = find_eqn(qnode_jaxpr, "cond")
+        x_var = qnode_jaxpr.invars[1]
+        assert cond_eqn.invars.count(x_var) == 1
+
+    def test_branch_captured_tracer_not_shared(self, backend):
+        """Test a conditional where a tracer is captured by only one of the branches."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(pred: bool, x: float):
+            @cond(pred)
+            def conditional_rotation():
+                qml.RX(x, wires=0)
+
+            @conditional_rotation.otherwise
+            def conditional_rotation():
+                qml.Identity(0)
+
+            conditional_rotation()
+
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.isclose(circuit(True, 0.4), np.cos(0.4))
+        assert np.isclose(circuit(False, 0.4), 1)
+
 
 class TestInterpretationConditional:
     """Test that the conditional operation's execution is semantically equivalent
@@ -441,6 +536,97 @@ class TestClassicalCompilation:
 
         assert arithi(x, y, op1, op2) == arithc(x, y, op1, op2)
 
+    def test_conditional_called_twice(self, monkeypatch):
+        """Test that the branches of a conditional called repeatedly in classical context are only
+        traced once."""
+
+        num_traces = 0
+
+        def trace_branches(*args, **kwargs):
+            nonlocal num_traces
+            num_traces += 1
+            return initial_style_jaxprs_with_common_consts1(*args, **kwargs)
+
+        monkeypatch.setattr(
+            "catalyst.pennylane_extensions.initial_style_jaxprs_with_common_consts1",
+            trace_branches,
+        )
+
+        @qjit
+        def arithc(x: int, y: int):
+            @cond(x > y)
+            def branch():
+                return x - y
+
+            @branch.otherwise
+            def branch():
+                return y - x
+
+            return branch() + branch()
+
+        assert num_traces == 1
+        assert arithc(3, 1) == 4
+        assert arithc(1, 3) == 4
+
+    def test_default_otherwise_traced_once(self, monkeypatch):
+        """Test that the default 'otherwise' branch is only traced once across several
+        conditionals in classical context."""
+
+        num_traces = 0
+
+        def otherwise_fn():
+            nonlocal num_traces
+            num_traces += 1
+
+        monkeypatch.setattr(
+            "catalyst.pennylane_extensions.CondCallable._default_otherwise_fn",
+            staticmethod(otherwise_fn),
+        )
+
+        @qjit
+        def arithc(x: int):
+            @cond(x > 0)
+            def positive():
+                pass
+
+            @cond(x > 1)
+            def larger_than_one():
+                pass
+
+            positive()
+            larger_than_one()
+            return x
+
+        assert num_traces == 1
+        assert arithc(2) == 2
+
+    def test_conditional_captured_value_rebound(self):
+        """Test that the branches of a conditional are traced again once a value captured by them
+        is rebound."""
+
+        scale = 2.0
+
+        @cond(True)
+        def branch():
+            return scale
+
+        @branch.otherwise
+        def branch():
+            return -scale
+
+        @qjit
+        def first(x: float):
+            return x * branch()
+
+        scale = 3.0
+
+        @qjit
+        def second(x: float):
+            return x * branch()
+
+        assert first(1.0) == 2.0
+        assert second(1.0) == 3.0
+
     def test_no_true_false_parameters(self):
         """Test non-empty parameter detection in conditionals"""
 
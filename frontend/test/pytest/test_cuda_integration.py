@@ -158,6 +158,22 @@ class TestCudaQ:
         observed = cuda_compiled(3.14)
         assert_allclose(expected, observed)
 
+    def test_samples_recompile(self):
+        """Test that QNode bodies traced for one compilation are not re-used by the next one, which
+        may see a different device configuration."""
+
+        dev = qml.device("softwareq.qpp", wires=1, shots=10)
+
+        @qml.qnode(dev)
+        def circuit(a):
+            qml.RX(a, wires=[0])
+            return qml.sample()
+
+        assert catalyst.cuda.qjit()(circuit)(3.14).shape[0] == 10
+
+        dev.shots = 20
+        assert catalyst.cuda.qjit()(circuit)(3.14).shape[0] == 20
+
     def test_counts(self):
         """Test SoftwareQQPP."""
 
@@ -782,6 +782,49 @@ def test_finite_diff_arbitrary_functions():
     assert workflow(0.0) == 2.0
 
 
+def test_finite_diff_repeated_function():
+    """Test that differentiating the same non-qnode function repeatedly traces it once."""
+
+    num_traces = 0
+
+    def _f(x):
+        nonlocal num_traces
+        num_traces += 1
+        return 2 * x
+
+    @qjit
+    def workflow(x):
+        return grad(_f, method="fd")(x) + grad(_f, method="fd")(2 * x)
+
+    assert workflow(0.0) == 4.0
+    assert num_traces == 1
+
+
+def test_finite_diff_repeated_function_device_change():
+    """Test that differentiated functions are traced again by a later compilation, after the device
+    of a QNode they call has been replaced."""
+
+    @qml.qnode(qml.device("lightning.qubit", wires=1))
+    def circuit(x):
+        qml.RX(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    def cost(x):
+        return 2 * circuit(x)
+
+    def workflow(x: float):
+        return grad(cost, method="fd")(x)
+
+    first = qjit(workflow)
+    assert np.allclose(first(0.5), -2 * np.sin(0.5), atol=1e-3)
+    assert "quantum.alloc( 1)" in first.mlir
+
+    circuit.device = qml.device("lightning.qubit", wires=2)
+    second = qjit(workflow)
+    assert np.allclose(second(0.5), -2 * np.sin(0.5), atol=1e-3)
+    assert "quantum.alloc( 2)" in second.mlir
+
+
 @pytest.mark.parametrize("inp", [(1.0), (2.0), (3.0), (4.0)])
 def test_finite_diff_higher_order(inp, backend):
     """Test finite diff."""
@@ -16,7 +16,7 @@ import jax.numpy as jnp
 import pennylane as qml
 import pytest
 
-from catalyst import CompileError, measure, qjit
+from catalyst import CompileError, for_loop, measure, qjit
 
 # TODO: add tests with other measurement processes (e.g. qml.sample, qml.probs, ...)
 
@@ -31,6 +31,20 @@ class TestMidCircuitMeasurement:
         with pytest.raises(CompileError, match="Must use 'measure' from Catalyst"):
             qjit(qml.qnode(qml.device(backend, wires=1))(circuit))()
 
+    def test_pl_measure_nested(self, backend):
+        """Test PL measure inside of a control-flow region."""
+
+        def circuit():
+            @for_loop(0, 2, 1)
+            def loop(_i):
+                qml.measure(0)
+
+            loop()
+            return qml.state()
+
+        with pytest.raises(CompileError, match="Must use 'measure' from Catalyst"):
+            qjit(qml.qnode(qml.device(backend, wires=1))(circuit))()
+
     def test_measure_outside_qjit(self):
         """Test measure outside qjit."""
 
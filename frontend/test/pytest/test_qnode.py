@@ -99,6 +99,63 @@ def test_qfunc_output_shape_scalar():
         return res * 1j
 
 
+def test_qfunc_tracing_is_cached():
+    """Check that repeated calls to a QNode with the same argument types only trace it once."""
+
+    num_traces = 0
+
+    @qml.qnode(qml.device("lightning.qubit", wires=1))
+    def circuit(x):
+        nonlocal num_traces
+        num_traces += 1
+        qml.RX(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    @qjit
+    def cost_fn(x: float):
+        return circuit(x) + circuit(2 * x)
+
+    assert jnp.allclose(cost_fn(0.5), jnp.cos(0.5) + jnp.cos(1.0))
+    assert num_traces == 1
+
+
+def test_qfunc_tracing_cache_closure():
+    """Check that QNodes capturing tracers from the enclosing scope are traced on every call."""
+
+    num_traces = 0
+
+    @qjit
+    def workflow(n: int):
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def circuit(x):
+            nonlocal num_traces
+            num_traces += 1
+            qml.RX(n * x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        return circuit(0.1) + circuit(0.2)
+
+    workflow(1)
+    assert num_traces == 2
+
+
+def test_qfunc_tracing_cache_recompile():
+    """Check that QNode bodies traced for one compilation are not re-used by the next one, which
+    may see a different device configuration."""
+
+    dev = qml.device("lightning.qubit", wires=1, shots=10)
+
+    @qml.qnode(dev)
+    def circuit(x):
+        qml.RX(x, wires=0)
+        return qml.sample()
+
+    assert qjit(circuit)(0.1).shape[0] == 10
+
+    dev.shots = 20
+    assert qjit(circuit)(0.1).shape[0] == 20
+
+
 @pytest.mark.xfail(reason="Preserving scalars is preferred over preserving length-1 containers.")
 def test_qfunc_output_shape_list():
     """Check that length-1 list outputs of QNodes are preserved."""
@@ -78,6 +78,9 @@ void FiniteDiffLowering::computeFiniteDiff(PatternRewriter &rewriter, Location l
     gradients.reserve(gradFn.getNumResults());
 
     func::CallOp callOp = rewriter.create<func::CallOp>(loc, callee, callArgs);
+    // The forward evaluations for scalar operands do not depend on the differentiated result, so
+    // they are emitted once per operand and shared by all the results.
+    std::vector<func::CallOp> scalarCallsForward(diffArgIndices.size());
     for (size_t diffResIdx = 0; diffResIdx < callee.getNumResults(); ++diffResIdx) {
         for (size_t diffArgIdxIdx = 0; diffArgIdxIdx < diffArgIndices.size(); ++diffArgIdxIdx) {
             size_t diffArgIdx = diffArgIndices[diffArgIdxIdx];
@@ -138,22 +141,26 @@ void FiniteDiffLowering::computeFiniteDiff(PatternRewriter &rewriter, Location l
                 isOperandScalarTensor
                     ? (TypedAttr)DenseFPElementsAttr::get(cast<ShapedType>(operandTy), hValue)
                     : (TypedAttr)rewriter.getFloatAttr(baseOperandTy, hValue);
-            Value hForOperand = rewriter.create<arith::ConstantOp>(loc, shiftForOperand);
 
             Value gradient;
             if (!isOperandTensor || isOperandScalarTensor) {
-                Value diffArgShifted = rewriter.create<arith::AddFOp>(loc, diffArg, hForOperand);
+                func::CallOp &callOpForward = scalarCallsForward[diffArgIdxIdx];
+                if (!callOpForward) {
+                    Value hForOperand = rewriter.create<arith::ConstantOp>(loc, shiftForOperand);
+                    Value diffArgShifted =
+                        rewriter.create<arith::AddFOp>(loc, diffArg, hForOperand);
 
-                std::vector<Value> callArgsForward(callArgs.begin(), callArgs.end());
-                callArgsForward[diffArgIdx] = diffArgShifted;
+                    std::vector<Value> callArgsForward(callArgs.begin(), callArgs.end());
+                    callArgsForward[diffArgIdx] = diffArgShifted;
 
-                func::CallOp callOpForward =
-                    rewriter.create<func::CallOp>(loc, callee, callArgsForward);
+                    callOpForward = rewriter.create<func::CallOp>(loc, callee, callArgsForward);
+                }
                 Value callResForward = callOpForward.getResult(diffResIdx);
 
                 gradient = rewriter.create<arith::SubFOp>(loc, callResForward, callRes);
             }
             else {
+                Value hForOperand = rewriter.create<arith::ConstantOp>(loc, shiftForOperand);
                 auto bodyBuilder = [&](OpBuilder &rewriter, Location loc,
                                        ValueRange tensorIndices) -> void {
                     Value diffArgElem = rewriter.create<tensor::ExtractOp>(
@@ -251,6 +251,32 @@ func.func @gradCallMultiRes(%arg0: tensor<7xf64>) -> (tensor<7xf64>, tensor<2x7x
 
 // -----
 
+// Check multiple results of a scalar operand case
+func.func private @funcScalarMultiRes(%arg0: f64) -> (f64, tensor<2xf64>) attributes {qnode, diff_method = "finite-diff"}
+
+// CHECK-LABEL: @funcScalarMultiRes.finitediff0(%arg0: f64) -> (f64, tensor<2xf64>)
+    // CHECK:        [[BASE:%.+]]:2 = call @funcScalarMultiRes(%arg0)
+    // CHECK:        [[SHIFTED:%.+]] = arith.addf %arg0
+    // CHECK-NEXT:   [[EVAL:%.+]]:2 = call @funcScalarMultiRes([[SHIFTED]])
+    // CHECK-NOT:    call @funcScalarMultiRes
+    // CHECK:        [[DIFF0:%.+]] = arith.subf [[EVAL]]#0, [[BASE]]#0
+    // CHECK:        [[R0:%.+]] = arith.divf [[DIFF0]]
+    // CHECK-NOT:    call @funcScalarMultiRes
+    // CHECK:        [[DIFF1:%.+]] = arith.subf [[EVAL]]#1, [[BASE]]#1
+    // CHECK:        [[R1:%.+]] = arith.divf [[DIFF1]]
+    // CHECK:        return [[R0]], [[R1]]
+// }
+
+// CHECK-LABEL: @gradCallScalarMultiRes
+func.func @gradCallScalarMultiRes(%arg0: f64) -> (f64, tensor<2xf64>)  {
+    // CHECK:   [[GRAD:%.+]]:2 = call @funcScalarMultiRes.finitediff0(%arg0) : (f64) -> (f64, tensor<2xf64>)
+    %0:2 = gradient.grad "fd"  @funcScalarMultiRes(%arg0) : (f64) -> (f64, tensor<2xf64>)
+    // CHECK:   return [[GRAD]]#0, [[GRAD]]#1
+    func.return %0#0, %0#1 : f64, tensor<2xf64>
+}
+
+// -----
+
 // Check dynamic tensor shape case
 func.func private @funcDynamicTensor(%arg0: tensor<?x3xf64>) -> tensor<2x?xf64> attributes {qnode, diff_method = "finite-diff"}
 